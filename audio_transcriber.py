@@ -1,14 +1,138 @@
 import whisper
+import torch
 import os
+import io
+import functools
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
-import json
+from typing import Optional, Dict, Any, List
 from datetime import datetime
-from project_structure import ProjectStructure
+import numpy as np
+import numba
+from project_structure import ProjectStructure, mtime_cached, write_transcription_outputs
+
+
+BACKENDS = ("whisper", "faster-whisper", "ort")
+
+# Compiled OpenVINO blobs are kept here so later runs skip recompilation
+OPENVINO_CACHE_DIR = ".ov_cache"
+
+# ONNX exports of the Whisper checkpoints, one subdirectory per model and provider
+ONNX_CACHE_DIR = ".onnx_cache"
+
+
+def _load_ort_pipeline(model_size: str, device: str):
+    """Load an ONNX Runtime Whisper model wrapped in a transformers ASR pipeline."""
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    from transformers import AutoProcessor, pipeline
+    
+    model_id = f"openai/whisper-{model_size}"
+    if device.startswith("cuda"):
+        # IO binding keeps decoder inputs/outputs on the GPU between steps
+        provider = "CUDAExecutionProvider"
+        provider_kwargs = {"use_io_binding": True}
+    elif "OpenVINOExecutionProvider" in onnxruntime.get_available_providers():
+        provider = "OpenVINOExecutionProvider"
+        provider_kwargs = {"provider_options": {"cache_dir": OPENVINO_CACHE_DIR}}
+    else:
+        provider = "CPUExecutionProvider"
+        provider_kwargs = {}
+    
+    # Exporting the PyTorch checkpoint to ONNX is slow; do it on the first
+    # run only and load the saved export afterwards
+    export_dir = Path(ONNX_CACHE_DIR) / f"whisper-{model_size}-{provider}"
+    if (export_dir / "config.json").exists():
+        model = ORTModelForSpeechSeq2Seq.from_pretrained(
+            export_dir, export=False, provider=provider, **provider_kwargs
+        )
+    else:
+        model = ORTModelForSpeechSeq2Seq.from_pretrained(
+            model_id, export=True, provider=provider, **provider_kwargs
+        )
+        # Save under a temporary name so an interrupted save is never loaded
+        partial_dir = export_dir.with_name(export_dir.name + ".partial")
+        model.save_pretrained(partial_dir)
+        os.replace(partial_dir, export_dir)
+    
+    processor = AutoProcessor.from_pretrained(model_id)
+    return pipeline(
+        "automatic-speech-recognition",
+        model=model,
+        tokenizer=processor.tokenizer,
+        feature_extractor=processor.feature_extractor,
+        chunk_length_s=30
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_whisper_model(model_size: str, device: Optional[str] = None,
+                        backend: str = "whisper", compute_type: str = "default"):
+    """Load a Whisper model once per (model_size, device, backend) and reuse it."""
+    print(f"Loading Whisper model: {model_size} ({backend})")
+    if backend == "faster-whisper":
+        from faster_whisper import WhisperModel
+        device_type, _, device_index = (device or "auto").partition(":")
+        return WhisperModel(model_size, device=device_type,
+                            device_index=int(device_index or 0),
+                            compute_type=compute_type)
+    if backend == "ort":
+        return _load_ort_pipeline(model_size, device or "cpu")
+    return whisper.load_model(model_size, device=device)
+
+
+@mtime_cached(maxsize=1)
+def _load_audio(audio_path: str) -> np.ndarray:
+    """
+    Decode an audio file to 16 kHz mono float32 with ffmpeg.
+    
+    Re-transcribing the same unchanged file (e.g. another backend or
+    output format) skips the ffmpeg decode. The most recent array stays in
+    memory until another file is decoded or _load_audio.cache_clear() is
+    called: about 230 MB per hour of audio, kept even after the source
+    file is deleted.
+    """
+    return whisper.load_audio(audio_path)
+
+
+@numba.njit(cache=True)
+def _fmt_ts_batch(times, out_h, out_m, out_s, out_ms):
+    """Split float seconds into hour/minute/second/millisecond integer arrays."""
+    for i in range(times.shape[0]):
+        # Integer milliseconds, so rounding never yields "60.000"
+        millis = np.int64(np.rint(times[i] * 1000.0))
+        secs = millis // 1000
+        minutes = secs // 60
+        out_h[i] = minutes // 60
+        out_m[i] = minutes % 60
+        out_s[i] = secs % 60
+        out_ms[i] = millis % 1000
+
+
+@dataclass
+class SegmentColumns:
+    """Segment start/end times and texts stored column-wise for subtitle rendering."""
+    __slots__ = ("starts", "ends", "texts")
+    
+    starts: np.ndarray
+    ends: np.ndarray
+    texts: List[str]
+    
+    @classmethod
+    def from_segments(cls, segments: List[Dict[str, Any]]) -> "SegmentColumns":
+        """Build the columns from Whisper's list of segment dicts in one pass each."""
+        count = len(segments)
+        return cls(
+            starts=np.fromiter((segment["start"] for segment in segments), dtype=np.float64, count=count),
+            ends=np.fromiter((segment["end"] for segment in segments), dtype=np.float64, count=count),
+            texts=[segment["text"].strip() for segment in segments]
+        )
 
 
 class AudioTranscriber:
-    def __init__(self, model_size: str = "base", use_project_structure: bool = True):
+    def __init__(self, model_size: str = "base", use_project_structure: bool = True,
+                 device: Optional[str] = None, fp16: Optional[bool] = None,
+                 backend: str = "whisper"):
         """
         Initialize the Whisper transcriber.
         
@@ -16,20 +140,46 @@ class AudioTranscriber:
             model_size: Size of the Whisper model to use.
                        Options: tiny, base, small, medium, large
             use_project_structure: Whether to use the new project structure
+            device: Torch device to run on ("cuda", "cpu", ...).
+                    Defaults to CUDA when available, otherwise CPU.
+            fp16: Whether to run inference in half precision.
+                  Defaults to True on CUDA and False on CPU.
+            backend: Inference backend, "whisper" (PyTorch),
+                     "faster-whisper" (CTranslate2) or "ort" (ONNX Runtime,
+                     using OpenVINO on CPU when it is installed)
         """
-        print(f"Loading Whisper model: {model_size}")
-        self.model = whisper.load_model(model_size)
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = device
+        self.fp16 = device.startswith("cuda") if fp16 is None else fp16
+        self.backend = backend
+        
+        self.compute_type = "default"
+        if backend == "faster-whisper":
+            # int8 is CTranslate2's fast path on CPU
+            if self.fp16:
+                self.compute_type = "float16"
+            elif device.startswith("cuda"):
+                self.compute_type = "float32"
+            else:
+                self.compute_type = "int8"
+        
+        self.model = _load_whisper_model(model_size, device, backend, self.compute_type)
+        self._batched_pipeline = None
         self.model_size = model_size
         self.use_project_structure = use_project_structure
         
         if not use_project_structure:
             self.output_dir = Path("transcriptions")
-            self.output_dir.mkdir(exist_ok=True)
+            ProjectStructure.ensure_dir(self.output_dir)
         else:
             self.project_manager = ProjectStructure()
     
     def transcribe_audio(self, audio_path: str, language: Optional[str] = None,
-                        output_format: str = "all", project_dirs: Optional[Dict[str, Path]] = None) -> Dict[str, Any]:
+                        output_format: str = "all", project_dirs: Optional[Dict[str, Path]] = None,
+                        batch_size: Optional[int] = None, verbose: bool = False) -> Dict[str, Any]:
         """
         Transcribe an audio file using Whisper.
         
@@ -38,6 +188,9 @@ class AudioTranscriber:
             language: Language code (e.g., 'ja' for Japanese, 'en' for English)
             output_format: Output format - 'text', 'srt', 'vtt', 'json', or 'all'
             project_dirs: Directory structure for project-based organization
+            batch_size: Decode VAD-split chunks in batches of this size
+                        (faster-whisper backend only; None disables batching)
+            verbose: Print each segment as it is decoded
         
         Returns:
             Dictionary containing transcription results
@@ -47,138 +200,242 @@ class AudioTranscriber:
         
         print(f"Transcribing: {audio_path}")
         
-        options = {
-            "language": language,
-            "task": "transcribe",
-            "verbose": True
-        }
-        
         if language:
             print(f"Language set to: {language}")
         
-        result = self.model.transcribe(audio_path, **options)
+        # Decode once and hand every backend the array, not the path
+        audio = _load_audio(audio_path)
+        result = self._run_model(audio, language, batch_size, verbose)
+        
+        # One timestamp for the settings record and the legacy output names
+        processed_at = datetime.now()
         
         # Save transcription settings
         transcription_settings = {
             "model_size": self.model_size,
+            "backend": self.backend,
+            "device": self.device,
+            "fp16": self.fp16,
             "language": language,
             "output_format": output_format,
-            "audio_file": audio_path
+            "audio_file": audio_path,
+            # Only faster-whisper batches; other backends ignore batch_size
+            "batch_size": batch_size if self.backend == "faster-whisper" else None
         }
         
-        outputs = {}
+        # Render every requested format once; both layouts write the same contents
+        output_contents = {}
+        if output_format in ["text", "all"]:
+            output_contents["text"] = result["text"]
+        if output_format in ["json", "all"]:
+            output_contents["json"] = result
+        if output_format in ["srt", "vtt", "all"]:
+            columns = SegmentColumns.from_segments(result["segments"])
+            if output_format in ["srt", "all"]:
+                output_contents["srt"] = self._generate_srt(columns)
+            if output_format in ["vtt", "all"]:
+                output_contents["vtt"] = self._generate_vtt(columns)
         
         if self.use_project_structure and project_dirs:
             # Save settings to project
             self.project_manager.save_transcription_settings(
-                project_dirs["project_dir"], transcription_settings
+                project_dirs["project_dir"], transcription_settings, processed_at
             )
             
-            # Prepare outputs for project structure
-            output_contents = {}
-            if output_format in ["text", "all"]:
-                output_contents["text"] = result["text"]
-            if output_format in ["json", "all"]:
-                output_contents["json"] = result
-            if output_format in ["srt", "all"]:
-                output_contents["srt"] = self._generate_srt(result["segments"])
-            if output_format in ["vtt", "all"]:
-                output_contents["vtt"] = self._generate_vtt(result["segments"])
-            
             # Save all outputs to project structure
             outputs = self.project_manager.save_transcription_outputs(
                 project_dirs, output_contents
             )
-            
-            for format_type, file_path in outputs.items():
-                print(f"{format_type.upper()} saved to: {file_path}")
         
         else:
             # Use old structure
             base_name = Path(audio_path).stem
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_base = self.output_dir / f"{base_name}_{timestamp}"
-            
-            if output_format in ["text", "all"]:
-                text_file = f"{output_base}.txt"
-                with open(text_file, "w", encoding="utf-8") as f:
-                    f.write(result["text"])
-                outputs["text"] = text_file
-                print(f"Text saved to: {text_file}")
-            
-            if output_format in ["json", "all"]:
-                json_file = f"{output_base}.json"
-                with open(json_file, "w", encoding="utf-8") as f:
-                    json.dump(result, f, ensure_ascii=False, indent=2)
-                outputs["json"] = json_file
-                print(f"JSON saved to: {json_file}")
-            
-            if output_format in ["srt", "all"]:
-                srt_file = f"{output_base}.srt"
-                self._write_srt(result["segments"], srt_file)
-                outputs["srt"] = srt_file
-                print(f"SRT saved to: {srt_file}")
-            
-            if output_format in ["vtt", "all"]:
-                vtt_file = f"{output_base}.vtt"
-                self._write_vtt(result["segments"], vtt_file)
-                outputs["vtt"] = vtt_file
-                print(f"VTT saved to: {vtt_file}")
+            timestamp = processed_at.strftime("%Y%m%d_%H%M%S")
+            outputs = write_transcription_outputs(
+                self.output_dir, output_contents, f"{base_name}_{timestamp}"
+            )
+        
+        for format_type, file_path in outputs.items():
+            print(f"{format_type.upper()} saved to: {file_path}")
         
         return {
             "text": result["text"],
             "language": result.get("language", "unknown"),
-            "duration": result.get("duration", 0),
+            "duration": result.get("duration", len(audio) / whisper.audio.SAMPLE_RATE),
             "output_files": outputs,
             "segments": result.get("segments", [])
         }
     
-    def _write_srt(self, segments, output_path):
-        """Write segments to SRT format."""
-        with open(output_path, "w", encoding="utf-8") as f:
-            for i, segment in enumerate(segments, 1):
-                start = self._format_timestamp(segment["start"], srt=True)
-                end = self._format_timestamp(segment["end"], srt=True)
-                text = segment["text"].strip()
-                f.write(f"{i}\n{start} --> {end}\n{text}\n\n")
+    def transcribe_many(self, audio_paths: List[str], language: Optional[str] = None,
+                        output_format: str = "all",
+                        project_dirs_list: Optional[List[Dict[str, Path]]] = None,
+                        batch_size: int = 16, verbose: bool = False) -> List[Dict[str, Any]]:
+        """
+        Transcribe several audio files with one loaded model.
+        
+        With the faster-whisper backend each file is decoded through a
+        BatchedInferencePipeline so its VAD-split chunks share GPU batches.
+        A file that fails to transcribe is reported and skipped, so one
+        corrupt file does not abandon the rest of the batch.
+        
+        Args:
+            audio_paths: Paths to the audio files
+            language: Language code applied to every file
+            output_format: Output format - 'text', 'srt', 'vtt', 'json', or 'all'
+            project_dirs_list: Project directories, one entry per audio file
+            batch_size: Number of chunks decoded per batch
+            verbose: Print each segment as it is decoded
+        
+        Returns:
+            List of transcription results, in the order of audio_paths;
+            failed files get {"audio_file": path, "error": message}
+        """
+        if project_dirs_list is None:
+            project_dirs_list = [None] * len(audio_paths)
+        
+        results = []
+        for audio_path, project_dirs in zip(audio_paths, project_dirs_list):
+            try:
+                results.append(self.transcribe_audio(
+                    audio_path=audio_path,
+                    language=language,
+                    output_format=output_format,
+                    project_dirs=project_dirs,
+                    batch_size=batch_size,
+                    verbose=verbose
+                ))
+            except Exception as e:
+                print(f"Failed to transcribe {audio_path}: {e}")
+                results.append({"audio_file": audio_path, "error": str(e)})
+        return results
+    
+    def _get_batched_pipeline(self):
+        """Wrap the faster-whisper model in a batched pipeline, once."""
+        if self._batched_pipeline is None:
+            from faster_whisper import BatchedInferencePipeline
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+        return self._batched_pipeline
     
-    def _write_vtt(self, segments, output_path):
-        """Write segments to WebVTT format."""
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("WEBVTT\n\n")
+    def _run_model(self, audio: np.ndarray, language: Optional[str],
+                   batch_size: Optional[int] = None, verbose: bool = False) -> Dict[str, Any]:
+        """Run the loaded backend on decoded audio and return a Whisper-style result dict."""
+        if self.backend == "faster-whisper":
+            if batch_size:
+                segments, info = self._get_batched_pipeline().transcribe(
+                    audio, language=language, task="transcribe", beam_size=5,
+                    batch_size=batch_size
+                )
+            else:
+                segments, info = self.model.transcribe(
+                    audio, language=language, task="transcribe", beam_size=5
+                )
+            # The segments generator drives decoding, so materialize it once
+            segment_dicts = []
             for segment in segments:
-                start = self._format_timestamp(segment["start"])
-                end = self._format_timestamp(segment["end"])
-                text = segment["text"].strip()
-                f.write(f"{start} --> {end}\n{text}\n\n")
+                if verbose:
+                    print(f"[{segment.start:.2f} --> {segment.end:.2f}] {segment.text}")
+                segment_dicts.append({
+                    "id": segment.id,
+                    "seek": segment.seek,
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text,
+                    "tokens": list(segment.tokens),
+                    "temperature": segment.temperature,
+                    "avg_logprob": segment.avg_logprob,
+                    "compression_ratio": segment.compression_ratio,
+                    "no_speech_prob": segment.no_speech_prob
+                })
+            return {
+                "text": "".join(segment["text"] for segment in segment_dicts),
+                "segments": segment_dicts,
+                "language": info.language,
+                "duration": info.duration
+            }
+        
+        if self.backend == "ort":
+            generate_kwargs = {"task": "transcribe"}
+            if language:
+                generate_kwargs["language"] = language
+            output = self.model(
+                {"raw": audio, "sampling_rate": whisper.audio.SAMPLE_RATE},
+                return_timestamps=True, generate_kwargs=generate_kwargs
+            )
+            duration = len(audio) / whisper.audio.SAMPLE_RATE
+            segment_dicts = []
+            for i, chunk in enumerate(output.get("chunks", [])):
+                start, end = chunk["timestamp"]
+                segment_dicts.append({
+                    "id": i,
+                    "start": start or 0.0,
+                    # The final chunk may be open-ended
+                    "end": end if end is not None else duration,
+                    "text": chunk["text"]
+                })
+            return {
+                "text": output["text"],
+                "segments": segment_dicts,
+                "language": language or "unknown",
+                "duration": duration
+            }
+        
+        options = {
+            "language": language,
+            "task": "transcribe",
+            # False keeps the progress bar but skips printing every segment
+            "verbose": verbose,
+            "fp16": self.fp16
+        }
+        return self.model.transcribe(audio, **options)
     
-    def _generate_srt(self, segments):
+    def _generate_srt(self, columns: SegmentColumns) -> str:
         """Generate SRT content as string."""
-        content = []
-        for i, segment in enumerate(segments, 1):
-            start = self._format_timestamp(segment["start"], srt=True)
-            end = self._format_timestamp(segment["end"], srt=True)
-            text = segment["text"].strip()
-            content.append(f"{i}\n{start} --> {end}\n{text}\n")
-        return "\n".join(content)
+        starts = self._fmt_ts_srt(columns.starts)
+        ends = self._fmt_ts_srt(columns.ends)
+        
+        buf = io.StringIO()
+        write = buf.write
+        for i, (start, end, text) in enumerate(zip(starts, ends, columns.texts), 1):
+            if i > 1:
+                write("\n")
+            write(f"{i}\n{start} --> {end}\n{text}\n")
+        return buf.getvalue()
     
-    def _generate_vtt(self, segments):
+    def _generate_vtt(self, columns: SegmentColumns) -> str:
         """Generate WebVTT content as string."""
-        content = ["WEBVTT\n"]
-        for segment in segments:
-            start = self._format_timestamp(segment["start"])
-            end = self._format_timestamp(segment["end"])
-            text = segment["text"].strip()
-            content.append(f"{start} --> {end}\n{text}\n")
-        return "\n".join(content)
+        starts = self._fmt_ts_vtt(columns.starts)
+        ends = self._fmt_ts_vtt(columns.ends)
+        
+        buf = io.StringIO()
+        write = buf.write
+        write("WEBVTT\n")
+        for start, end, text in zip(starts, ends, columns.texts):
+            write(f"\n{start} --> {end}\n{text}\n")
+        return buf.getvalue()
     
-    def _format_timestamp(self, seconds, srt=False):
-        """Format timestamp for SRT or VTT."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-        
-        if srt:
-            return f"{hours:02d}:{minutes:02d}:{secs:06.3f}".replace(".", ",")
-        else:
-            return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
\ No newline at end of file
+    @staticmethod
+    def _split_timestamps(times: np.ndarray):
+        """Split an array of times in seconds into h/m/s/ms integer lists."""
+        count = len(times)
+        hours = np.empty(count, dtype=np.int64)
+        minutes = np.empty(count, dtype=np.int64)
+        secs = np.empty(count, dtype=np.int64)
+        millis = np.empty(count, dtype=np.int64)
+        _fmt_ts_batch(np.ascontiguousarray(times, dtype=np.float64), hours, minutes, secs, millis)
+        return zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+    
+    @staticmethod
+    def _fmt_ts_srt(times: np.ndarray) -> List[str]:
+        """Format times as SRT timestamps (HH:MM:SS,mmm)."""
+        return [
+            f"{h:02d}:{m:02d}:{sec:02d},{ms:03d}"
+            for h, m, sec, ms in AudioTranscriber._split_timestamps(times)
+        ]
+    
+    @staticmethod
+    def _fmt_ts_vtt(times: np.ndarray) -> List[str]:
+        """Format times as WebVTT timestamps (HH:MM:SS.mmm)."""
+        return [
+            f"{h:02d}:{m:02d}:{sec:02d}.{ms:03d}"
+            for h, m, sec, ms in AudioTranscriber._split_timestamps(times)
+        ]
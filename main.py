@@ -1,29 +1,29 @@
 #!/usr/bin/env python3
 
 import argparse
+import glob
 import sys
+import threading
+from datetime import datetime
 from pathlib import Path
-from audio_transcriber import AudioTranscriber
+from audio_transcriber import AudioTranscriber, BACKENDS
 from youtube_downloader import YouTubeDownloader
 from project_structure import ProjectStructure
 
 
-def transcribe_local_audio(audio_path: str, model_size: str = "base",
-                          language: str = None, output_format: str = "all"):
+AUDIO_EXTENSIONS = {".mp3", ".m4a", ".wav", ".flac", ".ogg", ".opus", ".webm"}
+
+
+def _create_local_project(project_manager: ProjectStructure, audio_path: str,
+                          created_at: datetime = None, project_name: str = None):
     """
-    Transcribe a local audio file.
+    Create a local project for an audio file and copy the file into it.
     
-    Args:
-        audio_path: Path to the audio file
-        model_size: Whisper model size
-        language: Language code for transcription
-        output_format: Output format(s) to generate
-    """
-    print(f"\n=== Transcribing Local Audio ===")
-    print(f"File: {audio_path}")
+    The project is named after the file stem unless project_name is given.
     
-    # Create project structure for local audio
-    project_manager = ProjectStructure()
+    Returns:
+        Tuple of (project_dirs, path to the audio file inside the project)
+    """
     audio_file_path = Path(audio_path)
     
     metadata = {
@@ -33,9 +33,10 @@ def transcribe_local_audio(audio_path: str, model_size: str = "base",
     }
     
     project_dirs = project_manager.create_project(
-        project_name=audio_file_path.stem,
+        project_name=project_name or audio_file_path.stem,
         project_type="local",
-        metadata=metadata
+        metadata=metadata,
+        created_at=created_at
     )
     
     # Copy audio file to project structure
@@ -43,12 +44,97 @@ def transcribe_local_audio(audio_path: str, model_size: str = "base",
         audio_path, project_dirs, keep_original=True
     )
     
-    transcriber = AudioTranscriber(model_size=model_size)
+    return project_dirs, final_audio_path
+
+
+def _run_in_background(func, *args, **kwargs):
+    """
+    Start func(*args, **kwargs) on a daemon thread.
+    
+    Unlike an executor worker, a daemon thread is not joined at interpreter
+    exit, so an error or Ctrl-C elsewhere exits at once instead of waiting
+    for the call to finish.
+    
+    Returns:
+        A function that waits for the call and returns its result, or
+        re-raises its exception
+    """
+    outcome = {}
+    
+    def target():
+        try:
+            outcome["result"] = func(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    
+    def wait():
+        thread.join()
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+    
+    return wait
+
+
+def _unique_project_names(audio_paths):
+    """
+    Name a project for each file after its stem, suffixing _2, _3, ... when
+    another file in the batch already took that name (e.g. a/x.mp3 and
+    b/x.mp3, or x.mp3 and x.wav). Compared case-insensitively so names
+    also stay distinct on case-insensitive filesystems.
+    """
+    taken = set()
+    names = []
+    for audio_path in audio_paths:
+        stem = Path(audio_path).stem
+        name = stem
+        suffix = 2
+        while name.lower() in taken:
+            name = f"{stem}_{suffix}"
+            suffix += 1
+        taken.add(name.lower())
+        names.append(name)
+    return names
+
+
+def transcribe_local_audio(audio_path: str, model_size: str = "base",
+                          language: str = None, output_format: str = "all",
+                          device: str = None, fp16: bool = None,
+                          backend: str = "whisper", batch_size: int = None,
+                          verbose: bool = False):
+    """
+    Transcribe a local audio file.
+    
+    Args:
+        audio_path: Path to the audio file
+        model_size: Whisper model size
+        language: Language code for transcription
+        output_format: Output format(s) to generate
+        device: Torch device for inference (auto-detected if None)
+        fp16: Whether to use half precision (auto if None)
+        backend: Inference backend ("whisper", "faster-whisper" or "ort")
+        batch_size: Batch size for faster-whisper batched decoding (None disables)
+        verbose: Print each segment as it is decoded
+    """
+    print(f"\n=== Transcribing Local Audio ===")
+    print(f"File: {audio_path}")
+    
+    # Create project structure for local audio
+    project_manager = ProjectStructure()
+    project_dirs, final_audio_path = _create_local_project(project_manager, audio_path)
+    
+    transcriber = AudioTranscriber(model_size=model_size, device=device, fp16=fp16,
+                                   backend=backend)
     result = transcriber.transcribe_audio(
         audio_path=str(final_audio_path),
         language=language,
         output_format=output_format,
-        project_dirs=project_dirs
+        project_dirs=project_dirs,
+        batch_size=batch_size,
+        verbose=verbose
     )
     
     print(f"\n=== Transcription Complete ===")
@@ -67,7 +153,9 @@ def transcribe_local_audio(audio_path: str, model_size: str = "base",
 
 def transcribe_youtube(url: str, model_size: str = "base",
                       language: str = None, output_format: str = "all",
-                      audio_format: str = "mp3", keep_audio: bool = False):
+                      audio_format: str = "mp3", keep_audio: bool = False,
+                      device: str = None, fp16: bool = None,
+                      backend: str = "whisper", verbose: bool = False):
     """
     Download and transcribe audio from a YouTube video.
     
@@ -78,12 +166,26 @@ def transcribe_youtube(url: str, model_size: str = "base",
         output_format: Output format(s) to generate
         audio_format: Format for downloaded audio
         keep_audio: Whether to keep the downloaded audio file
+        device: Torch device for inference (auto-detected if None)
+        fp16: Whether to use half precision (auto if None)
+        backend: Inference backend ("whisper", "faster-whisper" or "ort")
+        verbose: Print each segment as it is decoded and show yt-dlp's full log
     """
     print(f"\n=== Processing YouTube Video ===")
     print(f"URL: {url}")
     
     downloader = YouTubeDownloader()
     
+    # Reject a bad URL before paying for a model load
+    downloader.validate_url(url)
+    
+    # Load the model in the background while the audio is downloaded;
+    # the download is network-bound and the model load is disk/GPU-bound
+    get_transcriber = _run_in_background(
+        AudioTranscriber, model_size=model_size, device=device, fp16=fp16,
+        backend=backend
+    )
+    
     print("\n1. Getting video information...")
     try:
         video_info = downloader.get_video_info(url)
@@ -97,20 +199,22 @@ def transcribe_youtube(url: str, model_size: str = "base",
     download_result = downloader.download_audio(
         url=url,
         audio_format=audio_format,
-        quality="best"
+        quality="best",
+        verbose=verbose
     )
     
     audio_file = download_result['audio_file']
     print(f"Audio saved to: {audio_file}")
     
     print("\n3. Transcribing audio...")
-    transcriber = AudioTranscriber(model_size=model_size)
+    transcriber = get_transcriber()
     
     # Pass project_dirs if available
     transcribe_kwargs = {
         "audio_path": audio_file,
         "language": language,
-        "output_format": output_format
+        "output_format": output_format,
+        "verbose": verbose
     }
     if "project_dirs" in download_result:
         transcribe_kwargs["project_dirs"] = download_result["project_dirs"]
@@ -137,6 +241,114 @@ def transcribe_youtube(url: str, model_size: str = "base",
     return result
 
 
+def transcribe_batch(source: str, model_size: str = "base",
+                     language: str = None, output_format: str = "all",
+                     device: str = None, fp16: bool = None,
+                     backend: str = "whisper", batch_size: int = 16,
+                     verbose: bool = False):
+    """
+    Transcribe every audio file in a directory or matching a glob pattern.
+    
+    Args:
+        source: Directory containing audio files, or a glob pattern
+        model_size: Whisper model size
+        language: Language code for transcription
+        output_format: Output format(s) to generate
+        device: Torch device for inference (auto-detected if None)
+        fp16: Whether to use half precision (auto if None)
+        backend: Inference backend ("whisper", "faster-whisper" or "ort")
+        batch_size: Batch size for faster-whisper batched decoding
+        verbose: Print each segment as it is decoded
+    
+    Returns:
+        One result per audio file, in sorted path order; a file that could
+        not be imported or transcribed gets {"audio_file", "error"} instead
+    """
+    print(f"\n=== Batch Transcription ===")
+    print(f"Source: {source}")
+    
+    source_path = Path(source)
+    if source_path.is_dir():
+        candidates = source_path.iterdir()
+    else:
+        candidates = map(Path, glob.glob(source))
+    
+    # Skip subdirectories and non-audio files before any project is created
+    audio_paths = sorted(
+        str(path) for path in candidates
+        if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS
+    )
+    
+    if not audio_paths:
+        print("No audio files found.")
+        return []
+    
+    print(f"Found {len(audio_paths)} audio file(s)")
+    
+    project_manager = ProjectStructure()
+    results = {}
+    imported_paths = []
+    project_dirs_list = []
+    final_audio_paths = []
+    new_project_dirs = set()
+    created_at = datetime.now()
+    project_names = _unique_project_names(audio_paths)
+    for audio_path, project_name in zip(audio_paths, project_names):
+        if project_name != Path(audio_path).stem:
+            print(f"Note: {audio_path} saved as project local_{project_name} (name already used in this batch)")
+        
+        project_dir = project_manager.project_dir_path(project_name, "local")
+        if not project_dir.exists():
+            new_project_dirs.add(project_dir)
+        
+        try:
+            project_dirs, final_audio_path = _create_local_project(
+                project_manager, audio_path, created_at, project_name
+            )
+        except Exception as e:
+            print(f"Failed to import {audio_path}: {e}")
+            results[audio_path] = {"audio_file": audio_path, "error": str(e)}
+            continue
+        
+        imported_paths.append(audio_path)
+        project_dirs_list.append(project_dirs)
+        final_audio_paths.append(str(final_audio_path))
+    
+    if final_audio_paths:
+        transcriber = AudioTranscriber(model_size=model_size, device=device, fp16=fp16,
+                                       backend=backend)
+        transcribed = transcriber.transcribe_many(
+            final_audio_paths,
+            language=language,
+            output_format=output_format,
+            project_dirs_list=project_dirs_list,
+            batch_size=batch_size,
+            verbose=verbose
+        )
+        results.update(zip(imported_paths, transcribed))
+    
+    # Don't leave half-filled projects behind for files that failed; projects
+    # that existed before this batch keep their earlier outputs
+    for audio_path, project_name in zip(audio_paths, project_names):
+        project_dir = project_manager.project_dir_path(project_name, "local")
+        if "error" in results[audio_path] and project_dir in new_project_dirs:
+            project_manager.remove_project(project_dir)
+    
+    print(f"\n=== Batch Transcription Complete ===")
+    failed = 0
+    for audio_path in audio_paths:
+        result = results[audio_path]
+        if "error" in result:
+            failed += 1
+            print(f"  - {audio_path}: FAILED ({result['error']})")
+        else:
+            print(f"  - {audio_path}: {result['language']}, {result['duration']:.2f} seconds")
+    if failed:
+        print(f"\n{failed} of {len(audio_paths)} file(s) failed")
+    
+    return [results[audio_path] for audio_path in audio_paths]
+
+
 def list_projects():
     """List all audio projects."""
     print(f"\n=== Audio Projects ===")
@@ -184,6 +396,40 @@ def main():
     audio_parser.add_argument("-f", "--format", default="all",
                             choices=["text", "srt", "vtt", "json", "all"],
                             help="Output format (default: all)")
+    audio_parser.add_argument("-d", "--device", default=None,
+                            help="Device for inference, e.g. 'cuda' or 'cpu' (default: cuda if available)")
+    audio_parser.add_argument("--fp16", default=None, action=argparse.BooleanOptionalAction,
+                            help="Use half precision inference (default: on for CUDA, off for CPU)")
+    audio_parser.add_argument("-b", "--backend", default="whisper",
+                            choices=list(BACKENDS),
+                            help="Inference backend (default: whisper)")
+    audio_parser.add_argument("-v", "--verbose", action="store_true",
+                            help="Print each segment as it is transcribed")
+    
+    audio_parser.add_argument("--batch-size", type=int, default=None,
+                            help="Batched decoding for long files (faster-whisper only)")
+    
+    batch_parser = subparsers.add_parser("batch", help="Transcribe all audio files in a directory or glob")
+    batch_parser.add_argument("source", help="Directory of audio files or a glob pattern (quote it)")
+    batch_parser.add_argument("-m", "--model", default="base",
+                            choices=["tiny", "base", "small", "medium", "large"],
+                            help="Whisper model size (default: base)")
+    batch_parser.add_argument("-l", "--language", default=None,
+                            help="Language code (e.g., 'ja' for Japanese, 'en' for English)")
+    batch_parser.add_argument("-f", "--format", default="all",
+                            choices=["text", "srt", "vtt", "json", "all"],
+                            help="Output format (default: all)")
+    batch_parser.add_argument("-d", "--device", default=None,
+                            help="Device for inference, e.g. 'cuda' or 'cpu' (default: cuda if available)")
+    batch_parser.add_argument("--fp16", default=None, action=argparse.BooleanOptionalAction,
+                            help="Use half precision inference (default: on for CUDA, off for CPU)")
+    batch_parser.add_argument("-b", "--backend", default="whisper",
+                            choices=list(BACKENDS),
+                            help="Inference backend (default: whisper)")
+    batch_parser.add_argument("-v", "--verbose", action="store_true",
+                            help="Print each segment as it is transcribed")
+    batch_parser.add_argument("--batch-size", type=int, default=None,
+                            help="Batch size for faster-whisper batched decoding (default: 16)")
     
     youtube_parser = subparsers.add_parser("youtube", help="Download and transcribe a YouTube video")
     youtube_parser.add_argument("url", help="YouTube video URL")
@@ -195,6 +441,15 @@ def main():
     youtube_parser.add_argument("-f", "--format", default="all",
                               choices=["text", "srt", "vtt", "json", "all"],
                               help="Output format (default: all)")
+    youtube_parser.add_argument("-d", "--device", default=None,
+                              help="Device for inference, e.g. 'cuda' or 'cpu' (default: cuda if available)")
+    youtube_parser.add_argument("--fp16", default=None, action=argparse.BooleanOptionalAction,
+                              help="Use half precision inference (default: on for CUDA, off for CPU)")
+    youtube_parser.add_argument("-b", "--backend", default="whisper",
+                              choices=list(BACKENDS),
+                              help="Inference backend (default: whisper)")
+    youtube_parser.add_argument("-v", "--verbose", action="store_true",
+                              help="Print each segment as it is transcribed and show the full download log")
     youtube_parser.add_argument("-a", "--audio-format", default="mp3",
                               choices=["mp3", "wav", "m4a"],
                               help="Audio format for download (default: mp3)")
@@ -207,6 +462,10 @@ def main():
         parser.print_help()
         sys.exit(1)
     
+    if getattr(args, "batch_size", None) is not None and args.backend != "faster-whisper":
+        print(f"Warning: --batch-size only applies to the faster-whisper backend; "
+              f"ignoring it for {args.backend}")
+    
     try:
         if args.command == "list":
             list_projects()
@@ -216,7 +475,25 @@ def main():
                 audio_path=args.file,
                 model_size=args.model,
                 language=args.language,
-                output_format=args.format
+                output_format=args.format,
+                device=args.device,
+                fp16=args.fp16,
+                backend=args.backend,
+                batch_size=args.batch_size,
+                verbose=args.verbose
+            )
+        
+        elif args.command == "batch":
+            transcribe_batch(
+                source=args.source,
+                model_size=args.model,
+                language=args.language,
+                output_format=args.format,
+                device=args.device,
+                fp16=args.fp16,
+                backend=args.backend,
+                batch_size=args.batch_size if args.batch_size is not None else 16,
+                verbose=args.verbose
             )
         
         elif args.command == "youtube":
@@ -226,7 +503,11 @@ def main():
                 language=args.language,
                 output_format=args.format,
                 audio_format=args.audio_format,
-                keep_audio=args.keep_audio
+                keep_audio=args.keep_audio,
+                device=args.device,
+                fp16=args.fp16,
+                backend=args.backend,
+                verbose=args.verbose
             )
     
     except KeyboardInterrupt:
@@ -1,14 +1,153 @@
 import os
-import json
+import functools
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Literal, Set
 from datetime import datetime
 
+import orjson
+
+
+ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+OUTPUT_EXTENSIONS = {
+    "text": "txt",
+    "json": "json",
+    "srt": "srt",
+    "vtt": "vtt"
+}
+
+
+PROJECT_PREFIXES = ("youtube_", "local_")
+
+
+def _has_entries(directory: Path) -> bool:
+    """Return True if the directory contains any non-hidden entry."""
+    try:
+        with os.scandir(directory) as entries:
+            # Stops at the first match instead of listing the whole directory
+            return any(not entry.name.startswith(".") for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def mtime_cached(maxsize: int):
+    """
+    Cache a one-argument file loader, keyed on the path and its mtime.
+    
+    Each call stats the file, so a file modified since it was cached is
+    loaded again; a missing file raises FileNotFoundError. The returned
+    function exposes cache_clear().
+    
+    Args:
+        maxsize: Number of (path, mtime) entries to keep
+    """
+    def decorator(load):
+        @functools.lru_cache(maxsize=maxsize)
+        def load_version(path: str, mtime_ns: int):
+            return load(path)
+        
+        @functools.wraps(load)
+        def wrapper(path):
+            path = str(path)
+            return load_version(path, os.stat(path).st_mtime_ns)
+        
+        wrapper.cache_clear = load_version.cache_clear
+        return wrapper
+    
+    return decorator
+
+
+@mtime_cached(maxsize=256)
+def _parse_json_file(path: str) -> Dict[str, Any]:
+    """Parse a project JSON file (metadata/settings), reused until it is rewritten."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a JSON file through the cache, or return None if it is missing."""
+    try:
+        # Shallow copy so callers cannot mutate the cached object
+        return dict(_parse_json_file(path))
+    except FileNotFoundError:
+        return None
+
+
+def _write_json(file_path: Path, data: Any):
+    """Serialize to indented UTF-8 JSON with a single write."""
+    Path(file_path).write_bytes(orjson.dumps(data, option=ORJSON_OPTIONS))
+
+
+def _write_output(file_path: Path, format_type: str, content: Any):
+    """Write a single rendered output file."""
+    if format_type == "json" and not isinstance(content, str):
+        _write_json(file_path, content)
+    else:
+        # Text formats and pre-serialized JSON are written verbatim
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def write_transcription_outputs(output_dir: Path, outputs: Dict[str, Any],
+                                base_name: str) -> Dict[str, str]:
+    """
+    Write rendered transcription outputs as <base_name>.<ext> files.
+    
+    The files are independent, so they are written concurrently; the GIL is
+    released during the write syscalls.
+    
+    Args:
+        output_dir: Directory to write the files into
+        outputs: Dictionary of output format -> content
+                 (text for text/srt/vtt, dict or JSON string for json)
+        base_name: Base name for output files
+    
+    Returns:
+        Dictionary of output format -> file path
+    """
+    saved_files = {
+        format_type: Path(output_dir) / f"{base_name}.{OUTPUT_EXTENSIONS[format_type]}"
+        for format_type in outputs
+    }
+    
+    if len(outputs) > 1:
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            futures = [
+                executor.submit(_write_output, saved_files[format_type], format_type, content)
+                for format_type, content in outputs.items()
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for format_type, content in outputs.items():
+            _write_output(saved_files[format_type], format_type, content)
+    
+    return {format_type: str(file_path) for format_type, file_path in saved_files.items()}
+
 
 class ProjectStructure:
     """音声プロジェクトのディレクトリ構造を管理するクラス"""
     
+    # Directories already created in this process, shared by all instances
+    _created_dirs: Set[Path] = set()
+    
+    @classmethod
+    def ensure_dir(cls, path: Path):
+        """
+        Create a directory (and parents) unless this process already did.
+        
+        Skips the stat + mkdir syscalls on repeat calls. A directory removed
+        externally while the process runs is not recreated.
+        
+        Args:
+            path: Directory to create
+        """
+        if path not in cls._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            cls._created_dirs.add(path)
+    
     def __init__(self, base_dir: str = "audio_projects"):
         """
         Initialize project structure manager.
@@ -17,10 +156,11 @@ class ProjectStructure:
             base_dir: Base directory for all audio projects
         """
         self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(exist_ok=True)
+        self.ensure_dir(self.base_dir)
     
     def create_project(self, project_name: str, project_type: str = "local", 
-                      metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Path]:
+                      metadata: Optional[Dict[str, Any]] = None,
+                      created_at: Optional[datetime] = None) -> Dict[str, Path]:
         """
         Create a new audio project with the standard directory structure.
         
@@ -28,34 +168,24 @@ class ProjectStructure:
             project_name: Name for the project (will be prefixed based on type)
             project_type: Type of project ("youtube" or "local")
             metadata: Additional metadata to save
+            created_at: Creation time to record (defaults to now); pass one
+                        shared value when creating many projects at once
         
         Returns:
             Dictionary containing paths to created directories
         """
-        # Create project folder with appropriate prefix
-        if project_type == "youtube":
-            folder_name = f"youtube_{project_name}"
-        else:
-            folder_name = f"local_{project_name}"
-        
-        project_dir = self.base_dir / folder_name
+        project_dir = self.project_dir_path(project_name, project_type)
         
         # Create directory structure
-        project_dir.mkdir(exist_ok=True)
         src_audio_dir = project_dir / "src_audio"
         transcription_dir = project_dir / "transcription"
         
-        src_audio_dir.mkdir(exist_ok=True)
-        transcription_dir.mkdir(exist_ok=True)
+        self.ensure_dir(src_audio_dir)
+        self.ensure_dir(transcription_dir)
         
         # Save metadata
         if metadata:
-            metadata_file = project_dir / "metadata.json"
-            metadata["created_at"] = datetime.now().isoformat()
-            metadata["project_type"] = project_type
-            
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            self.save_metadata(project_dir, metadata, project_type, created_at)
         
         return {
             "project_dir": project_dir,
@@ -63,27 +193,75 @@ class ProjectStructure:
             "transcription_dir": transcription_dir
         }
     
-    def save_transcription_settings(self, project_dir: Path, settings: Dict[str, Any]):
+    def project_dir_path(self, project_name: str, project_type: str = "local") -> Path:
+        """
+        Return the directory a project lives in, without creating it.
+        
+        Args:
+            project_name: Name for the project (will be prefixed based on type)
+            project_type: Type of project ("youtube" or "local")
+        
+        Returns:
+            Path to the project directory
+        """
+        # Create project folder with appropriate prefix
+        if project_type == "youtube":
+            folder_name = f"youtube_{project_name}"
+        else:
+            folder_name = f"local_{project_name}"
+        
+        return self.base_dir / folder_name
+    
+    def remove_project(self, project_dir: Path):
+        """
+        Delete a project directory and everything in it.
+        
+        Args:
+            project_dir: Path to the project directory
+        """
+        shutil.rmtree(project_dir, ignore_errors=True)
+        # Forget its directories so a later create_project makes them again.
+        # Other threads may be adding to the set, so scan a snapshot of it
+        self._created_dirs.difference_update(
+            [path for path in list(self._created_dirs) if path.is_relative_to(project_dir)]
+        )
+    
+    def save_metadata(self, project_dir: Path, metadata: Dict[str, Any],
+                      project_type: str = "local", created_at: Optional[datetime] = None):
+        """
+        Save project metadata, stamped with its creation time and type.
+        
+        Args:
+            project_dir: Path to the project directory
+            metadata: Metadata to save
+            project_type: Type of project ("youtube" or "local")
+            created_at: Creation time to record (defaults to now)
+        """
+        metadata["created_at"] = (created_at or datetime.now()).isoformat()
+        metadata["project_type"] = project_type
+        
+        _write_json(project_dir / "metadata.json", metadata)
+    
+    def save_transcription_settings(self, project_dir: Path, settings: Dict[str, Any],
+                                    processed_at: Optional[datetime] = None):
         """
         Save transcription settings to the project.
         
         Args:
             project_dir: Path to the project directory
             settings: Transcription settings to save
+            processed_at: Processing time to record (defaults to now)
         """
-        transcription_dir = project_dir / "transcription"
-        settings_file = transcription_dir / "settings.json"
-        
         settings_data = {
             **settings,
-            "processed_at": datetime.now().isoformat()
+            "processed_at": (processed_at or datetime.now()).isoformat()
         }
         
-        with open(settings_file, "w", encoding="utf-8") as f:
-            json.dump(settings_data, f, ensure_ascii=False, indent=2)
+        _write_json(project_dir / "transcription" / "settings.json", settings_data)
     
     def move_audio_to_project(self, audio_file: str, project_dirs: Dict[str, Path], 
-                             keep_original: bool = False) -> Path:
+                             keep_original: bool = False,
+                             link_mode: Literal["hardlink", "symlink", "copy"] = "hardlink") -> Path:
         """
         Move or copy audio file to the project's src_audio directory.
         
@@ -91,6 +269,9 @@ class ProjectStructure:
             audio_file: Path to the original audio file
             project_dirs: Dictionary containing project directories
             keep_original: Whether to keep the original file (copy instead of move)
+            link_mode: How to keep the original when keep_original is True.
+                       "hardlink" and "symlink" avoid copying the audio bytes;
+                       a failed link (e.g. across filesystems) falls back to a copy.
         
         Returns:
             Path to the audio file in the project directory
@@ -99,9 +280,30 @@ class ProjectStructure:
         dest_path = project_dirs["src_audio_dir"] / audio_path.name
         
         if keep_original:
+            if dest_path.exists() and dest_path.samefile(audio_path):
+                # Already linked (or already in place) from an earlier run
+                if link_mode != "copy" or os.path.abspath(dest_path) == os.path.abspath(audio_path):
+                    return dest_path
+                dest_path.unlink()
+            
+            if link_mode != "copy":
+                try:
+                    dest_path.unlink(missing_ok=True)
+                    if link_mode == "symlink":
+                        os.symlink(audio_path.resolve(), dest_path)
+                    else:
+                        os.link(audio_path, dest_path)
+                    return dest_path
+                except OSError:
+                    pass
             shutil.copy2(audio_path, dest_path)
         else:
-            shutil.move(str(audio_path), dest_path)
+            try:
+                # Same filesystem: a single rename, no stat-ing or copying
+                os.replace(audio_path, dest_path)
+            except OSError:
+                # e.g. across filesystems; shutil.move copies then deletes
+                shutil.move(str(audio_path), dest_path)
         
         return dest_path
     
@@ -118,31 +320,9 @@ class ProjectStructure:
         Returns:
             Dictionary of output format -> file path
         """
-        transcription_dir = project_dirs["transcription_dir"]
-        saved_files = {}
-        
-        for format_type, content in outputs.items():
-            if format_type == "text":
-                file_path = transcription_dir / f"{base_name}.txt"
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-            elif format_type == "json":
-                file_path = transcription_dir / f"{base_name}.json"
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(json.loads(content) if isinstance(content, str) else content, 
-                             f, ensure_ascii=False, indent=2)
-            elif format_type == "srt":
-                file_path = transcription_dir / f"{base_name}.srt"
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-            elif format_type == "vtt":
-                file_path = transcription_dir / f"{base_name}.vtt"
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-            
-            saved_files[format_type] = str(file_path)
-        
-        return saved_files
+        return write_transcription_outputs(
+            project_dirs["transcription_dir"], outputs, base_name
+        )
     
     def list_projects(self) -> list:
         """
@@ -151,14 +331,16 @@ class ProjectStructure:
         Returns:
             List of project directory names
         """
-        if not self.base_dir.exists():
+        try:
+            with os.scandir(self.base_dir) as entries:
+                # Check the name first; DirEntry.is_dir() reuses the cached d_type
+                projects = [
+                    entry.name for entry in entries
+                    if entry.name.startswith(PROJECT_PREFIXES) and entry.is_dir()
+                ]
+        except FileNotFoundError:
             return []
         
-        projects = []
-        for item in self.base_dir.iterdir():
-            if item.is_dir() and (item.name.startswith("youtube_") or item.name.startswith("local_")):
-                projects.append(item.name)
-        
         return sorted(projects)
     
     def get_project_info(self, project_name: str) -> Optional[Dict[str, Any]]:
@@ -179,20 +361,18 @@ class ProjectStructure:
         info = {
             "name": project_name,
             "path": str(project_dir),
-            "has_audio": len(list((project_dir / "src_audio").glob("*"))) > 0,
-            "has_transcription": len(list((project_dir / "transcription").glob("*"))) > 0,
+            "has_audio": _has_entries(project_dir / "src_audio"),
+            "has_transcription": _has_entries(project_dir / "transcription"),
         }
         
         # Load metadata if exists
-        metadata_file = project_dir / "metadata.json"
-        if metadata_file.exists():
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                info["metadata"] = json.load(f)
+        metadata = _read_json(project_dir / "metadata.json")
+        if metadata is not None:
+            info["metadata"] = metadata
         
         # Load transcription settings if exists
-        settings_file = project_dir / "transcription" / "settings.json"
-        if settings_file.exists():
-            with open(settings_file, "r", encoding="utf-8") as f:
-                info["transcription_settings"] = json.load(f)
+        settings = _read_json(project_dir / "transcription" / "settings.json")
+        if settings is not None:
+            info["transcription_settings"] = settings
         
         return info
\ No newline at end of file
@@ -1,9 +1,96 @@
-import yt_dlp
 import os
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 import re
-from project_structure import ProjectStructure
+import string
+import threading
+import time
+
+if TYPE_CHECKING:
+    # Annotations only; the runtime import is deferred to first use
+    import yt_dlp
+
+
+_ID_CHARSET = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Every supported URL shape in one alternation, so a URL is scanned once
+_ID_RE = re.compile(r'(?:youtu\.be/|/embed/|/live/|/shorts/|/v/|[?&]v=)([0-9A-Za-z_-]{11})')
+
+# Canonical watch URL handed to yt-dlp, whatever form the caller used
+_WATCH_URL = "https://www.youtube.com/watch?v={}"
+
+# Video metadata fields we keep, with the default used when yt-dlp omits one
+_INFO_FIELDS = (
+    ("title", "Unknown"),
+    ("duration", 0),
+    ("uploader", "Unknown"),
+    ("upload_date", "Unknown"),
+    ("view_count", 0),
+    ("description", ""),
+)
+
+# Minimum seconds between progress lines printed by the quiet progress hook
+PROGRESS_INTERVAL = 1.0
+
+# FFmpeg audio bitrate (kbps) for each named quality preset
+_QUALITY_BITRATE = {
+    "best": "192",
+    "worst": "64",
+    "high": "256",
+}
+
+# Fixed YoutubeDL options; extract_flat is left at its default (False)
+_BASE_INFO_OPTS = (
+    ('quiet', True),
+    ('no_warnings', True),
+)
+_BASE_DOWNLOAD_OPTS = (
+    ('format', 'bestaudio/best'),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_info_ydl() -> "yt_dlp.YoutubeDL":
+    """Return the shared YoutubeDL used for metadata lookups, creating it once."""
+    # yt_dlp takes a few hundred ms to import; defer it until a lookup needs it
+    import yt_dlp
+    
+    return yt_dlp.YoutubeDL(dict(_BASE_INFO_OPTS))
+
+
+# YoutubeDL instances are not thread-safe; serialize use of the shared one
+_INFO_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=512)
+def _fetch_info(video_id: str, full: bool = False) -> Dict[str, Any]:
+    """
+    Fetch video metadata once per video ID; repeat lookups skip the network.
+    
+    Unless full is set, extraction runs with process=False: yt-dlp returns
+    the extractor's metadata without resolving formats, which is most of
+    the cost of a lookup.
+    """
+    with _INFO_LOCK:
+        info = _get_info_ydl().extract_info(
+            _WATCH_URL.format(video_id), download=False, process=full
+        )
+    
+    result = {key: info.get(key, default) for key, default in _INFO_FIELDS}
+    result["video_id"] = info.get("id", "")
+    if full:
+        result["formats"] = info.get("formats", [])
+    
+    return result
+
+
+def _remove_partial_downloads(directory: Path, video_id: str):
+    """Delete the .part/.ytdl files an interrupted yt-dlp download left behind."""
+    for pattern in (f"{video_id}.*.part*", f"{video_id}.*.ytdl"):
+        for path in directory.glob(pattern):
+            path.unlink(missing_ok=True)
 
 
 class YouTubeDownloader:
@@ -14,15 +101,82 @@ class YouTubeDownloader:
         Args:
             use_project_structure: Whether to use the new project structure
         """
+        from project_structure import ProjectStructure
+        
         self.use_project_structure = use_project_structure
         if use_project_structure:
             self.project_manager = ProjectStructure()
+            # Download straight into <project>/src_audio; no temp dir or move
+            project_dir = str(self.project_manager.project_dir_path("%(id)s", "youtube"))
+            self._output_template = os.path.join(project_dir, "src_audio", "%(id)s.%(ext)s")
         else:
             self.output_dir = Path("audio_files")
-            self.output_dir.mkdir(exist_ok=True)
+            ProjectStructure.ensure_dir(self.output_dir)
+            self._output_template = os.path.join(str(self.output_dir), "%(id)s.%(ext)s")
+        
+        # Download YoutubeDL instances, one per thread and settings
+        self._local = threading.local()
+    
+    def _on_progress(self, status: Dict[str, Any]):
+        """
+        yt-dlp progress hook: print a short progress line at most once per
+        PROGRESS_INTERVAL seconds, plus one line when a download finishes.
+        """
+        now = time.monotonic()
+        if status["status"] == "downloading":
+            if now - getattr(self._local, "last_progress", 0.0) < PROGRESS_INTERVAL:
+                return
+            
+            downloaded = status.get("downloaded_bytes") or 0
+            total = status.get("total_bytes") or status.get("total_bytes_estimate")
+            if total:
+                print(f"  {downloaded / total:6.1%} of {total / 1e6:.1f} MB")
+            else:
+                print(f"  {downloaded / 1e6:.1f} MB")
+        elif status["status"] == "finished":
+            print(f"  Downloaded {status.get('filename', '')}")
+        
+        self._local.last_progress = now
+    
+    def _get_download_ydl(self, audio_format: str, quality: str,
+                          verbose: bool = False) -> "yt_dlp.YoutubeDL":
+        """
+        Return a reusable YoutubeDL for downloads with the given settings.
+        
+        The output template is keyed on %(id)s rather than a specific video,
+        so one instance can serve every download on the calling thread.
+        """
+        instances = getattr(self._local, "instances", None)
+        if instances is None:
+            instances = self._local.instances = {}
+        
+        key = (audio_format, quality, verbose)
+        if key not in instances:
+            import yt_dlp
+            
+            ydl_opts = dict(
+                _BASE_DOWNLOAD_OPTS,
+                postprocessors=[{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': audio_format,
+                    # Named presets, else a raw kbps string such as '160'
+                    'preferredquality': _QUALITY_BITRATE.get(quality, quality if quality.isdigit() else '128'),
+                }],
+                outtmpl=self._output_template,
+                # Pin the post-processed extension so the output path is known
+                final_ext=audio_format,
+                quiet=not verbose,
+                no_warnings=not verbose,
+            )
+            if not verbose:
+                # yt-dlp's own log writes every progress tick to stdout
+                ydl_opts['progress_hooks'] = [self._on_progress]
+            instances[key] = yt_dlp.YoutubeDL(ydl_opts)
+        
+        return instances[key]
     
     def download_audio(self, url: str, audio_format: str = "mp3",
-                      quality: str = "best") -> Dict[str, Any]:
+                      quality: str = "best", verbose: bool = False) -> Dict[str, Any]:
         """
         Download audio from a YouTube video.
         
@@ -30,157 +184,199 @@ class YouTubeDownloader:
             url: YouTube video URL
             audio_format: Output audio format (mp3, wav, m4a, etc.)
             quality: Audio quality (best, worst, or specific bitrate)
+            verbose: Show yt-dlp's full log instead of throttled progress
         
         Returns:
             Dictionary containing download information
         """
-        video_id = self._extract_video_id(url)
-        if not video_id:
-            raise ValueError(f"Invalid YouTube URL: {url}")
+        video_id = self.validate_url(url)
+        
+        ydl = self._get_download_ydl(audio_format, quality, verbose)
+        
+        try:
+            return self._download_one(ydl, url, video_id, audio_format)
+        except Exception as e:
+            raise Exception(f"Failed to download audio: {str(e)}")
+    
+    def _download_one(self, ydl: "yt_dlp.YoutubeDL", url: str, video_id: str,
+                      audio_format: str) -> Dict[str, Any]:
+        """
+        Download one video with the given YoutubeDL and build its result.
+        
+        The metadata is extracted first without processing, so the project
+        directories and metadata.json are written on a worker thread while
+        the same extraction result is processed and downloaded.
+        """
+        print(f"Downloading audio from: {url}")
+        
+        # yt-dlp resolves the canonical form without re-parsing the caller's
+        # URL; the original url is still what the result records
+        info = ydl.extract_info(_WATCH_URL.format(video_id), download=False, process=False)
+        base = {key: info.get(key, default) for key, default in _INFO_FIELDS}
         
         if self.use_project_structure:
-            temp_output_dir = Path("temp_downloads")
-            temp_output_dir.mkdir(exist_ok=True)
-            output_template = str(temp_output_dir / f"{video_id}.%(ext)s")
+            project_dir = self.project_manager.project_dir_path(video_id, "youtube")
+            download_dir = project_dir / "src_audio"
+            created_project = not project_dir.exists()
         else:
-            output_template = str(self.output_dir / f"{video_id}.%(ext)s")
-        
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': audio_format,
-                'preferredquality': '192' if quality == 'best' else '128',
-            }],
-            'outtmpl': output_template,
-            'quiet': False,
-            'no_warnings': False,
-            'extract_flat': False,
+            download_dir = self.output_dir
+        
+        try:
+            return self._process_download(ydl, info, base, url, video_id, audio_format)
+        except BaseException:
+            # Leave no half-downloaded project behind for list to report
+            if self.use_project_structure and created_project:
+                self.project_manager.remove_project(project_dir)
+            else:
+                _remove_partial_downloads(download_dir, video_id)
+            raise
+    
+    def _process_download(self, ydl: "yt_dlp.YoutubeDL", info: Dict[str, Any],
+                          base: Dict[str, Any], url: str, video_id: str,
+                          audio_format: str) -> Dict[str, Any]:
+        """Download an extracted video, creating its project alongside."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if self.use_project_structure:
+                # Record the video metadata in the project
+                metadata = {**base, "video_id": video_id, "url": url}
+                project_future = executor.submit(
+                    self.project_manager.create_project,
+                    project_name=video_id,
+                    project_type="youtube",
+                    metadata=metadata
+                )
+            
+            info = ydl.process_ie_result(info, download=True)
+            # The exact path yt-dlp wrote, with the extractor's extension
+            # swapped for the one FFmpegExtractAudio produced
+            audio_file = f"{os.path.splitext(ydl.prepare_filename(info))[0]}.{audio_format}"
+            
+            if self.use_project_structure:
+                return {
+                    **base,
+                    "video_id": video_id,
+                    "audio_file": audio_file,
+                    "format": audio_format,
+                    "url": url,
+                    "project_dirs": project_future.result()
+                }
+        
+        return {
+            **base,
+            "video_id": video_id,
+            "audio_file": audio_file,
+            "format": audio_format,
+            "url": url
         }
+    
+    def download_audio_batch(self, urls: List[str], audio_format: str = "mp3",
+                             quality: str = "best", verbose: bool = False) -> List[Dict[str, Any]]:
+        """
+        Download audio from several YouTube videos, one after another,
+        continuing past failures.
         
-        print(f"Downloading audio from: {url}")
+        Unlike calling download_audio in a loop, an invalid URL or a failed
+        download does not stop the batch: it is reported, recorded in the
+        results, and the remaining URLs are still downloaded.
         
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                
-                if self.use_project_structure:
-                    temp_dir = Path("temp_downloads")
-                    audio_file = temp_dir / f"{video_id}.{audio_format}"
-                    
-                    if not audio_file.exists():
-                        for file in temp_dir.glob(f"{video_id}.*"):
-                            if file.suffix.lower() in ['.mp3', '.m4a', '.wav', '.opus', '.webm']:
-                                audio_file = file
-                                break
-                    
-                    # Create project structure
-                    metadata = {
-                        "title": info.get("title", "Unknown"),
-                        "duration": info.get("duration", 0),
-                        "uploader": info.get("uploader", "Unknown"),
-                        "video_id": video_id,
-                        "url": url,
-                        "upload_date": info.get("upload_date", "Unknown"),
-                        "view_count": info.get("view_count", 0),
-                        "description": info.get("description", "")
-                    }
-                    
-                    project_dirs = self.project_manager.create_project(
-                        project_name=video_id,
-                        project_type="youtube",
-                        metadata=metadata
-                    )
-                    
-                    # Move audio file to project structure
-                    final_audio_file = self.project_manager.move_audio_to_project(
-                        str(audio_file), project_dirs, keep_original=False
-                    )
-                    
-                    # Clean up temp directory
-                    if temp_dir.exists():
-                        import shutil
-                        shutil.rmtree(temp_dir, ignore_errors=True)
-                    
-                    return {
-                        "title": info.get("title", "Unknown"),
-                        "duration": info.get("duration", 0),
-                        "uploader": info.get("uploader", "Unknown"),
-                        "video_id": video_id,
-                        "audio_file": str(final_audio_file),
-                        "format": audio_format,
-                        "url": url,
-                        "project_dirs": project_dirs
-                    }
-                else:
-                    audio_file = self.output_dir / f"{video_id}.{audio_format}"
-                    
-                    if not audio_file.exists():
-                        for file in self.output_dir.glob(f"{video_id}.*"):
-                            if file.suffix.lower() in ['.mp3', '.m4a', '.wav', '.opus', '.webm']:
-                                audio_file = file
-                                break
-                    
-                    return {
-                        "title": info.get("title", "Unknown"),
-                        "duration": info.get("duration", 0),
-                        "uploader": info.get("uploader", "Unknown"),
-                        "video_id": video_id,
-                        "audio_file": str(audio_file),
-                        "format": audio_format,
-                        "url": url
-                    }
+        Args:
+            urls: YouTube video URLs
+            audio_format: Output audio format (mp3, wav, m4a, etc.)
+            quality: Audio quality (best, worst, or specific bitrate)
+            verbose: Show yt-dlp's full log instead of throttled progress
         
-        except Exception as e:
-            raise Exception(f"Failed to download audio: {str(e)}")
+        Returns:
+            List of download information dictionaries, in the order of urls;
+            failed URLs get {"url": url, "error": message}
+        """
+        results = []
+        for url in urls:
+            try:
+                results.append(self.download_audio(url, audio_format, quality, verbose))
+            except Exception as e:
+                print(f"Failed to download {url}: {e}")
+                results.append({"url": url, "error": str(e)})
+        
+        failed = sum("error" in result for result in results)
+        if failed:
+            print(f"{failed} of {len(urls)} download(s) failed")
+        
+        return results
+    
+    def download_many(self, urls: List[str], audio_format: str = "mp3",
+                      quality: str = "best", max_workers: int = 8,
+                      verbose: bool = False) -> List[Dict[str, Any]]:
+        """
+        Download audio from several YouTube videos concurrently.
+        
+        Downloads are network/FFmpeg-bound, so threads overlap them well;
+        each worker thread uses its own YoutubeDL instance and each video
+        downloads into its own project directory.
+        
+        Args:
+            urls: YouTube video URLs
+            audio_format: Output audio format (mp3, wav, m4a, etc.)
+            quality: Audio quality (best, worst, or specific bitrate)
+            max_workers: Maximum number of simultaneous downloads
+            verbose: Show yt-dlp's full log instead of throttled progress
+        
+        Returns:
+            List of download information dictionaries, in the order of urls
+        """
+        download = functools.partial(self.download_audio, audio_format=audio_format,
+                                     quality=quality, verbose=verbose)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(download, urls))
+    
+    def validate_url(self, url: str) -> str:
+        """
+        Check that a URL (or bare ID) names a YouTube video.
+        
+        Args:
+            url: YouTube video URL
+        
+        Returns:
+            The 11-character video ID
+        
+        Raises:
+            ValueError: If no video ID can be found in the URL
+        """
+        video_id = self._extract_video_id(url)
+        if not video_id:
+            raise ValueError(f"Invalid YouTube URL: {url}")
+        return video_id
     
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        patterns = [
-            r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-            r'(?:embed\/)([0-9A-Za-z_-]{11})',
-            r'(?:watch\?v=)([0-9A-Za-z_-]{11})',
-            r'(?:youtu\.be\/)([0-9A-Za-z_-]{11})',
-            r'(?:live\/)([0-9A-Za-z_-]{11})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        # A bare 11-character ID needs no regex scan
+        if len(url) == 11 and _ID_CHARSET.issuperset(url):
+            return url
+        
+        match = _ID_RE.search(url)
+        return match.group(1) if match else None
     
-    def get_video_info(self, url: str) -> Dict[str, Any]:
+    def get_video_info(self, url: str, full: bool = False) -> Dict[str, Any]:
         """
         Get information about a YouTube video without downloading.
         
         Args:
             url: YouTube video URL
+            full: Also resolve the available formats (slower); they are
+                  returned under "formats"
         
         Returns:
             Dictionary containing video information
         """
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-        }
+        video_id = self.validate_url(url)
         
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                return {
-                    "title": info.get("title", "Unknown"),
-                    "duration": info.get("duration", 0),
-                    "uploader": info.get("uploader", "Unknown"),
-                    "upload_date": info.get("upload_date", "Unknown"),
-                    "view_count": info.get("view_count", 0),
-                    "description": info.get("description", ""),
-                    "video_id": info.get("id", ""),
-                    "url": url
-                }
-        
+            info = _fetch_info(video_id, full)
         except Exception as e:
-            raise Exception(f"Failed to get video info: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Failed to get video info: {str(e)}")
+        
+        return {**info, "url": url}
+    
+    @classmethod
+    def clear_info_cache(cls):
+        """Forget all cached video information."""
+        _fetch_info.cache_clear()
\ No newline at end of file